@@ -0,0 +1,95 @@
+"""
+Byteswapping of big-endian FITS data to little-endian for the wire.
+
+FITS stores data big-endian, so nearly every slice sent to the browser has to
+be byteswapped. When numba is installed, large 2-, 4- and 8-byte arrays are
+swapped by multithreaded JIT kernels. The kernels are compiled (or loaded
+from numba's on-disk cache) at import, so no request pays for JIT warmup,
+and they release the GIL so the server's event loop keeps running while
+they execute. Otherwise (and for small or unusual arrays) numpy's byteswap
+is used.
+"""
+
+import threading
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+# Below this many bytes, starting the numba thread pool costs more than the
+# swap itself
+_KERNEL_MIN_BYTES = 256 * 1024
+
+_KERNELS = {}
+
+if njit is not None:
+    _M8 = np.uint16(0xFF)
+    _S8_16 = np.uint16(8)
+
+    _M8_32 = np.uint32(0x00FF00FF)
+    _M16_32 = np.uint32(0x0000FFFF)
+    _S8_32 = np.uint32(8)
+    _S16_32 = np.uint32(16)
+
+    _M8_64 = np.uint64(0x00FF00FF00FF00FF)
+    _M16_64 = np.uint64(0x0000FFFF0000FFFF)
+    _M32_64 = np.uint64(0x00000000FFFFFFFF)
+    _S8_64 = np.uint64(8)
+    _S16_64 = np.uint64(16)
+    _S32_64 = np.uint64(32)
+
+    @njit(parallel=True, nogil=True, cache=True, boundscheck=False)
+    def _swap16_copy(src, dst):
+        for i in prange(src.size):
+            x = src[i]
+            dst[i] = ((x >> _S8_16) & _M8) | ((x & _M8) << _S8_16)
+
+    @njit(parallel=True, nogil=True, cache=True, boundscheck=False)
+    def _swap32_copy(src, dst):
+        for i in prange(src.size):
+            x = src[i]
+            x = ((x >> _S8_32) & _M8_32) | ((x & _M8_32) << _S8_32)
+            dst[i] = ((x >> _S16_32) & _M16_32) | ((x & _M16_32) << _S16_32)
+
+    @njit(parallel=True, nogil=True, cache=True, boundscheck=False)
+    def _swap64_copy(src, dst):
+        for i in prange(src.size):
+            x = src[i]
+            x = ((x >> _S8_64) & _M8_64) | ((x & _M8_64) << _S8_64)
+            x = ((x >> _S16_64) & _M16_64) | ((x & _M16_64) << _S16_64)
+            dst[i] = ((x >> _S32_64) & _M32_64) | ((x & _M32_64) << _S32_64)
+
+    _KERNELS = {
+        2: (np.uint16, _swap16_copy),
+        4: (np.uint32, _swap32_copy),
+        8: (np.uint64, _swap64_copy),
+    }
+
+    # Compile (or load from cache) now rather than on the first large request
+    for _uint, _kernel in _KERNELS.values():
+        _kernel(np.zeros(1, dtype=_uint), np.empty(1, dtype=_uint))
+
+# numba's default workqueue threading layer aborts the process if parallel
+# kernels are launched from several threads at once
+_KERNEL_LOCK = threading.Lock()
+
+
+def to_little_endian(arr: np.ndarray) -> np.ndarray:
+    """
+    Return a C-contiguous little-endian copy of the big-endian array arr.
+    """
+    le_dtype = arr.dtype.newbyteorder('<')
+    kernel = _KERNELS.get(arr.dtype.itemsize)
+    if kernel is None or arr.dtype.kind not in 'iuf' or arr.nbytes < _KERNEL_MIN_BYTES:
+        return np.ascontiguousarray(arr.byteswap().view(le_dtype))
+
+    uint, swap_copy = kernel
+    src = np.ascontiguousarray(arr).view(uint).reshape(-1)
+    dst = np.empty_like(src)
+    with _KERNEL_LOCK:
+        swap_copy(src, dst)
+    return dst.view(le_dtype).reshape(arr.shape)
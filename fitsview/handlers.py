@@ -2,14 +2,67 @@
 API handlers for FITS file operations.
 """
 
+import asyncio
 import json
+import os
+import re
+import sys
+import threading
 import tornado
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from enum import Enum
+from functools import lru_cache, partial
 from jupyter_server.base.handlers import APIHandler, JupyterHandler
 from jupyter_server.utils import url_path_join
+from tornado.http1connection import HTTP1Connection
+from tornado.iostream import StreamClosedError
 from astropy.io import fits
 import numpy as np
 
+from ._swap import to_little_endian
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def _dumps(obj) -> str:
+        """Serialize obj to a JSON string, using orjson when it is installed."""
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+else:
+    _dumps = json.dumps
+
+
+# Size of each write when streaming a slice response
+_CHUNK_SIZE = 1024 * 1024
+
+# Slices larger than this are gzip-compressed for clients that accept it.
+# Level 1 keeps compression cheap relative to the transfer time it saves.
+_GZIP_MIN_BYTES = 256 * 1024
+
+# Values accepted by FITSSliceHandler's precision argument (see _quantize)
+_PRECISIONS = ('f32', 'u16')
+
+# One "start:stop" range of the slices argument, followed by a comma or the
+# end of the string. A trailing comma leaves nothing for the next match, so
+# "0:2," is rejected like any other empty range.
+_SLICE_RE = re.compile(r'\s*(-?\d+)\s*:\s*(-?\d+)\s*(,|\Z)')
+
+# Longest slices argument accepted, so oversized input is rejected before
+# it is parsed or added to the _parse_slices cache
+_MAX_SLICES_LENGTH = 256
+
+# Largest stop used in the vectorized slice bounds check
+_INT64_MAX = np.iinfo(np.int64).max
+
+# Maximum number of open HDULists kept between requests
+_HDU_CACHE_SIZE = 32
+
 
 class ArrayType(str, Enum):
     """
@@ -32,6 +85,25 @@ class ArrayType(str, Enum):
     FLOAT64 = "f64"
 
 
+# ArrayType for each (dtype.kind, dtype.itemsize) this extension can send
+_DTYPE_TABLE = {
+    ('i', 1): ArrayType.INT8,
+    ('i', 2): ArrayType.INT16,
+    ('i', 4): ArrayType.INT32,
+    ('i', 8): ArrayType.INT64,
+    ('u', 1): ArrayType.UINT8,
+    ('u', 2): ArrayType.UINT16,
+    ('u', 4): ArrayType.UINT32,
+    ('u', 8): ArrayType.UINT64,
+    ('f', 4): ArrayType.FLOAT32,
+    ('f', 8): ArrayType.FLOAT64,
+    ('b', 1): ArrayType.UINT8,  # Boolean - treat as uint8
+}
+
+# ArrayType values already looked up, keyed by the dtype itself
+_DTYPE_VALUE_CACHE: dict[np.dtype, str] = {}
+
+
 def numpy_dtype_to_array_type(dtype: np.dtype) -> ArrayType:
     """
     Map a numpy dtype to an ArrayType based on kind and itemsize.
@@ -45,38 +117,392 @@ def numpy_dtype_to_array_type(dtype: np.dtype) -> ArrayType:
       'S', 'a' - byte string
       'U' - unicode string
       'V' - void (raw data)
+
+    Unsupported types default to ArrayType.FLOAT64.
+    """
+    return _DTYPE_TABLE.get((dtype.kind, dtype.itemsize), ArrayType.FLOAT64)
+
+
+def _array_type_value(dtype: np.dtype) -> str:
+    """Return numpy_dtype_to_array_type(dtype).value, memoized per dtype."""
+    value = _DTYPE_VALUE_CACHE.get(dtype)
+    if value is None:
+        value = numpy_dtype_to_array_type(dtype).value
+        _DTYPE_VALUE_CACHE[dtype] = value
+    return value
+
+
+# ArrayType of unscaled image data for each BITPIX value
+_BITPIX_TABLE = {
+    8: ArrayType.UINT8,
+    16: ArrayType.INT16,
+    32: ArrayType.INT32,
+    64: ArrayType.INT64,
+    -32: ArrayType.FLOAT32,
+    -64: ArrayType.FLOAT64,
+}
+
+_IMAGE_HDU_TYPES = (fits.PrimaryHDU, fits.ImageHDU, fits.CompImageHDU)
+_TABLE_HDU_TYPES = (fits.BinTableHDU, fits.TableHDU)
+
+
+def header_to_array_type(header: fits.Header) -> ArrayType:
+    """
+    Determine the ArrayType astropy will give an image HDU's data from its
+    header, without reading the data.
+
+    Follows astropy's scaling rules: integer data with BZERO, BSCALE or BLANK
+    is scaled to float32 (BITPIX 8, 16) or float64 (BITPIX 32, 64), except
+    that BSCALE = 1 with BZERO = -128 (BITPIX 8) or 2**(BITPIX - 1) is the
+    FITS convention for int8 and unsigned integers. Floating-point data keeps
+    its type.
+    """
+    bitpix = header['BITPIX']
+    bscale = header.get('BSCALE', 1)
+    bzero = header.get('BZERO', 0)
+
+    if bitpix > 0 and (bscale != 1 or bzero != 0 or 'BLANK' in header):
+        if bscale == 1:
+            if bitpix == 8 and bzero == -128:
+                return ArrayType.INT8
+            if bitpix == 16 and bzero == 1 << 15:
+                return ArrayType.UINT16
+            if bitpix == 32 and bzero == 1 << 31:
+                return ArrayType.UINT32
+            if bitpix == 64 and bzero == 1 << 63:
+                return ArrayType.UINT64
+        return ArrayType.FLOAT64 if bitpix > 16 else ArrayType.FLOAT32
+
+    return _BITPIX_TABLE.get(bitpix, ArrayType.FLOAT64)
+
+
+class _CacheEntry:
+    """An open HDUList and the (st_mtime_ns, st_size) of the file it was opened from.
+
+    astropy HDUList objects are not safe to use from several threads at once
+    (lazily loading an HDU seeks and reads the shared file handle), so worker
+    threads hold `lock` for as long as they touch `hdul`.
+
+    `header_reprs` caches repr(header) by HDU index, so it lives exactly as
+    long as the HDUList it was computed from.
+
+    `users` counts the requests currently holding the entry (see
+    _cached_hdul), and `evicted` is set once it has left the cache; the
+    HDUList is closed only when both say nobody can use it any more. Both are
+    guarded by _HDU_CACHE_LOCK.
+    """
+
+    def __init__(self, signature: tuple[int, int], hdul: fits.HDUList):
+        self.signature = signature
+        self.hdul = hdul
+        self.lock = threading.Lock()
+        self.header_reprs: dict[int, str] = {}
+        self.users = 0
+        self.evicted = False
+
+
+# Open HDULists keyed by filesystem path, least recently used first. The lock
+# only guards operations on the dict and entries' bookkeeping; opening and
+# closing files happens outside it, so a slow file never holds up cache
+# lookups for other files.
+_HDU_CACHE: 'OrderedDict[str, _CacheEntry]' = OrderedDict()
+_HDU_CACHE_LOCK = threading.Lock()
+
+# astropy I/O is synchronous, so it runs here rather than on the event loop
+_FITS_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(8, os.cpu_count() or 1),
+    thread_name_prefix='fitsview',
+)
+
+
+class _InvalidRequest(ValueError):
+    """Raised from worker threads for errors that are reported to the client as 400."""
+
+
+def _close_entry(entry: _CacheEntry):
+    with entry.lock:
+        entry.hdul.close()
+
+
+def _evict(entry: _CacheEntry, to_close: list):
+    """Mark entry as out of the cache, queueing it to close if it is unused.
+
+    Must be called with _HDU_CACHE_LOCK held.
+    """
+    entry.evicted = True
+    if entry.users == 0:
+        to_close.append(entry)
+
+
+async def _acquire_hdul(os_path: str) -> _CacheEntry:
+    """
+    Return the cache entry holding an open HDUList for os_path, reusing one
+    from a previous request if the file has not changed since, and register
+    the caller as a user of it. Every call must be paired with
+    _release_hdul; use _cached_hdul rather than calling these directly.
+
+    Files are opened with lazy_load_hdus=True so that only the HDUs a request
+    actually touches have their headers read. Entries are invalidated when the
+    file's mtime or size changes, and closed once they have left the cache and
+    the last request using them has released them.
+    """
+    loop = asyncio.get_running_loop()
+    # Even a cache hit stats the file, so it is kept off the event loop too
+    st = await loop.run_in_executor(_FITS_EXECUTOR, os.stat, os_path)
+    signature = (st.st_mtime_ns, st.st_size)
+    with _HDU_CACHE_LOCK:
+        entry = _HDU_CACHE.get(os_path)
+        if entry is not None and entry.signature == signature:
+            _HDU_CACHE.move_to_end(os_path)
+            entry.users += 1
+            return entry
+
+    # astropy memory-maps unscaled data by default; forcing memmap=True
+    # would make it refuse images with BZERO/BSCALE/BLANK keywords
+    hdul = await loop.run_in_executor(
+        _FITS_EXECUTOR, partial(fits.open, os_path, lazy_load_hdus=True)
+    )
+    entry = _CacheEntry(signature, hdul)
+
+    to_close = []
+    with _HDU_CACHE_LOCK:
+        current = _HDU_CACHE.get(os_path)
+        if current is not None and current.signature == signature:
+            # Another request opened the same file while this one was
+            # opening it; keep theirs
+            _HDU_CACHE.move_to_end(os_path)
+            to_close.append(entry)
+            entry = current
+        else:
+            if current is not None:
+                _evict(current, to_close)
+            _HDU_CACHE[os_path] = entry
+            _HDU_CACHE.move_to_end(os_path)
+            while len(_HDU_CACHE) > _HDU_CACHE_SIZE:
+                _, evicted = _HDU_CACHE.popitem(last=False)
+                _evict(evicted, to_close)
+        entry.users += 1
+
+    for stale in to_close:
+        await loop.run_in_executor(_FITS_EXECUTOR, _close_entry, stale)
+    return entry
+
+
+async def _release_hdul(entry: _CacheEntry):
+    """Unregister a user of entry, closing it if it was the last user of an evicted entry."""
+    with _HDU_CACHE_LOCK:
+        entry.users -= 1
+        close = entry.evicted and entry.users == 0
+    if close:
+        await asyncio.get_running_loop().run_in_executor(_FITS_EXECUTOR, _close_entry, entry)
+
+
+@asynccontextmanager
+async def _cached_hdul(os_path: str):
+    """Hold the cache entry for os_path (see _acquire_hdul) for the duration of the block."""
+    entry = await _acquire_hdul(os_path)
+    try:
+        yield entry
+    finally:
+        await _release_hdul(entry)
+
+
+def _read_metadata(entry: _CacheEntry) -> list:
+    """
+    Collect the per-HDU metadata returned by FITSMetadataHandler.
+
+    Everything happens in one worker call: lazily loading HDUs advances
+    through the shared file handle, so it must run in order under the entry's
+    lock, and what remains per HDU is GIL-bound header formatting that gains
+    nothing from being spread across threads.
+    """
+    with entry.lock:
+        return [_hdu_info(entry, i, hdu) for i, hdu in enumerate(entry.hdul)]
+
+
+def _hdu_info(entry: _CacheEntry, i: int, hdu) -> dict:
+    """
+    Collect the metadata for one HDU from its header, never reading its data.
     """
-    kind = dtype.kind
-    size = dtype.itemsize
-
-    if kind == 'i':  # Signed integer
-        if size == 1:
-            return ArrayType.INT8
-        elif size == 2:
-            return ArrayType.INT16
-        elif size == 4:
-            return ArrayType.INT32
-        elif size == 8:
-            return ArrayType.INT64
-    elif kind == 'u':  # Unsigned integer
-        if size == 1:
-            return ArrayType.UINT8
-        elif size == 2:
-            return ArrayType.UINT16
-        elif size == 4:
-            return ArrayType.UINT32
-        elif size == 8:
-            return ArrayType.UINT64
-    elif kind == 'f':  # Floating-point
-        if size == 4:
-            return ArrayType.FLOAT32
-        elif size == 8:
-            return ArrayType.FLOAT64
-    elif kind == 'b':  # Boolean - treat as uint8
-        return ArrayType.UINT8
-
-    # Default to float64 for unsupported types
-    return ArrayType.FLOAT64
+    # Use repr() to get the raw 80-column card format with newlines
+    # str() returns an object description, repr() returns the actual content
+    header_str = entry.header_reprs.get(i)
+    if header_str is None:
+        header_str = repr(hdu.header)
+        entry.header_reprs[i] = header_str
+
+    hdu_info = {
+        'index': i,
+        'name': hdu.name,
+        'type': hdu.__class__.__name__,
+        'header': header_str,  # Raw 80-column format string
+    }
+    # Shape and type come from the header alone, so listing a file never
+    # reads (or memory-maps) any of its data
+    naxis = hdu.header.get('NAXIS', 0)
+    if naxis > 0 and isinstance(hdu, fits.GroupsHDU):
+        # Random groups (a PrimaryHDU subclass) are records with a zero
+        # NAXIS1, so they are described by their group count like a table
+        hdu_info['shape'] = [hdu.header['GCOUNT']]
+        hdu_info['arrayType'] = None
+    elif naxis > 0 and isinstance(hdu, _IMAGE_HDU_TYPES):
+        # FITS lists NAXIS1 (the fastest-varying axis) first, NumPy last
+        hdu_info['shape'] = [hdu.header[f'NAXIS{n}'] for n in range(naxis, 0, -1)]
+        # Use ArrayType enum for consistent type representation
+        hdu_info['arrayType'] = header_to_array_type(hdu.header).value
+    elif naxis > 0 and isinstance(hdu, _TABLE_HDU_TYPES):
+        # Tables are described by their row count
+        hdu_info['shape'] = [hdu.header['NAXIS2']]
+        hdu_info['arrayType'] = None
+    else:
+        hdu_info['shape'] = None
+        hdu_info['arrayType'] = None
+    return hdu_info
+
+
+@lru_cache(maxsize=1024)
+def _parse_slices(slices_str: str) -> tuple[tuple[int, int], ...]:
+    """
+    Parse the slices argument ("start:stop,start:stop,...") into a tuple of
+    (start, stop) pairs, one per axis. Raises ValueError if it is malformed.
+
+    Viewers re-request the same few slices while panning, so parsed results
+    are cached.
+    """
+    slice_tuples = []
+    pos = 0
+    while True:
+        m = _SLICE_RE.match(slices_str, pos)
+        if m is None:
+            s = slices_str[pos:].split(',', 1)[0]
+            raise ValueError(f"Invalid slice format: '{s}'. Expected 'start:stop'.")
+        s = m.group(0).rstrip(',')
+        start, stop = int(m.group(1)), int(m.group(2))
+        if start < 0 or stop < 0:
+            raise ValueError(f"Negative indices not supported: '{s}'")
+        if start >= stop:
+            raise ValueError(f"Start must be less than stop: '{s}'")
+        slice_tuples.append((start, stop))
+        pos = m.end()
+        if not m.group(3):
+            return tuple(slice_tuples)
+
+
+def _quantize(slice_data: np.ndarray, precision: str) -> tuple[np.ndarray, tuple[float, float] | None]:
+    """
+    Reduce slice_data to the lossy preview precision requested.
+
+    'f32' casts float64 data to float32. 'u16' linearly rescales data wider
+    than 16 bits so that its finite minimum and maximum map to 0 and 65535;
+    NaN and -inf become 0 and +inf becomes 65535. Returns the new array and,
+    for 'u16', the (min, max) needed to undo the scaling. Data already at or
+    below the requested precision is returned unchanged.
+    """
+    if precision == 'f32':
+        if slice_data.dtype.kind == 'f' and slice_data.dtype.itemsize > 4:
+            return slice_data.astype(np.float32), None
+        return slice_data, None
+
+    if slice_data.dtype.itemsize <= 2:
+        return slice_data, None
+    values = np.asarray(slice_data, dtype=np.float64)
+    finite = values[np.isfinite(values)]
+    if finite.size:
+        vmin, vmax = float(finite.min()), float(finite.max())
+    else:
+        vmin = vmax = 0.0
+    scale = 65535 / (vmax - vmin) if vmax > vmin else 0.0
+    values = np.nan_to_num(values, nan=vmin, posinf=vmax, neginf=vmin)
+    return np.rint((values - vmin) * scale).astype(np.uint16), (vmin, vmax)
+
+
+def _read_slice(
+    entry: _CacheEntry,
+    hdu: int,
+    slice_tuples: tuple[tuple[int, int], ...],
+    precision: str | None = None,
+) -> tuple[np.ndarray, str, tuple[float, float] | None]:
+    """
+    Extract a slice of an HDU's data for FITSSliceHandler.
+
+    Returns a C-contiguous little-endian array ready to be sent, its
+    ArrayType value, and the (min, max) scale if the data was quantized to
+    'u16' (see _quantize). Raises _InvalidRequest if the HDU or slices don't
+    fit the file.
+    """
+    with entry.lock:
+        hdul = entry.hdul
+        # Indexing reads HDU headers only up to the one requested, where
+        # len(hdul) would force every HDU in the file to be read
+        try:
+            image_hdu = hdul[hdu]
+        except IndexError:
+            raise _InvalidRequest(f'HDU index {hdu} out of range (file has {len(hdul)} HDUs)')
+
+        # Checked from the header so that bad requests never read any data
+        if (
+            not isinstance(image_hdu, _IMAGE_HDU_TYPES)
+            or isinstance(image_hdu, fits.GroupsHDU)
+            or image_hdu.header.get('NAXIS', 0) == 0
+        ):
+            raise _InvalidRequest(f'HDU {hdu} has no data')
+        shape = image_hdu.shape
+        ndim = len(shape)
+
+        # Validate number of slice dimensions matches data dimensions
+        if len(slice_tuples) != ndim:
+            raise _InvalidRequest(
+                f'Number of slice dimensions ({len(slice_tuples)}) does not match '
+                f'data dimensions ({ndim}). Data shape: {list(shape)}'
+            )
+
+        # Validate slice bounds for all axes at once, finding the offending
+        # axis only on failure. Stops are clamped to the int64 range (no
+        # FITS axis comes close) so that huge values fail the check instead
+        # of overflowing.
+        stops = np.fromiter(
+            (min(stop, _INT64_MAX) for _, stop in slice_tuples), dtype=np.int64, count=ndim
+        )
+        out_of_bounds = stops > np.asarray(shape, dtype=np.int64)
+        if out_of_bounds.any():
+            axis = int(out_of_bounds.argmax())
+            start, stop = slice_tuples[axis]
+            raise _InvalidRequest(
+                f'Slice [{start}:{stop}] on axis {axis} out of bounds '
+                f'for dimension size {shape[axis]}. Data shape: {list(shape)}'
+            )
+
+        # Build the slice tuple and extract data. HDU.section reads (and
+        # scales) only the requested region from disk instead of the whole
+        # data array; CompImageHDU only has it from astropy 5.3 on.
+        numpy_slices = tuple(slice(start, stop) for start, stop in slice_tuples)
+        if hasattr(image_hdu, 'section'):
+            slice_data = np.asarray(image_hdu.section[numpy_slices])
+        else:
+            slice_data = image_hdu.data[numpy_slices]
+
+    scale = None
+    if precision is not None:
+        slice_data, scale = _quantize(slice_data, precision)
+    out_dtype = slice_data.dtype
+
+    # Use ArrayType enum for consistent type representation
+    array_type = _array_type_value(out_dtype)
+
+    # Convert to little-endian for JavaScript TypedArray compatibility.
+    # Data already in little-endian order (e.g. after astropy applies
+    # BZERO/BSCALE) is sent as-is.
+    byteorder = out_dtype.byteorder
+    needs_swap = byteorder == '>' or (byteorder == '=' and sys.byteorder != 'little')
+    if needs_swap:
+        return to_little_endian(slice_data), array_type, scale
+    # Unscaled data that needs no swap (BITPIX 8) comes back from
+    # HDU.section as a view of astropy's memory map. Copy it here so that
+    # page faults happen on this thread rather than in the event loop's
+    # socket write, and so the array outlives the HDUList it came from.
+    if slice_data.base is not None or not slice_data.flags.c_contiguous:
+        slice_data = np.array(slice_data, order='C', copy=True)
+    return slice_data, array_type, scale
 
 
 class FITSMetadataHandler(APIHandler):
@@ -92,43 +518,25 @@ class FITSMetadataHandler(APIHandler):
             await cm.get(path, content=False)
         except Exception as e:
             self.set_status(404)
-            self.finish(json.dumps({'error': f'File not found: {path}'}))
+            self.finish(_dumps({'error': f'File not found: {path}'}))
             return
 
         # Get filesystem path for astropy
         os_path = cm._get_os_path(path)
 
         try:
-            with fits.open(os_path) as hdul:
-                hdus = []
-                for i, hdu in enumerate(hdul):
-                    # Use repr() to get the raw 80-column card format with newlines
-                    # str() returns an object description, repr() returns the actual content
-                    header_str = repr(hdu.header)
-
-                    hdu_info = {
-                        'index': i,
-                        'name': hdu.name,
-                        'type': hdu.__class__.__name__,
-                        'header': header_str,  # Raw 80-column format string
-                    }
-                    if hdu.data is not None:
-                        hdu_info['shape'] = list(hdu.data.shape)
-                        # Use ArrayType enum for consistent type representation
-                        hdu_info['arrayType'] = numpy_dtype_to_array_type(hdu.data.dtype).value
-                    else:
-                        hdu_info['shape'] = None
-                        hdu_info['arrayType'] = None
-                    hdus.append(hdu_info)
-
-                result = {
-                    'path': path,
-                    'hdus': hdus
-                }
-                self.finish(json.dumps(result))
+            loop = asyncio.get_running_loop()
+            async with _cached_hdul(os_path) as entry:
+                hdus = await loop.run_in_executor(_FITS_EXECUTOR, _read_metadata, entry)
+
+            result = {
+                'path': path,
+                'hdus': hdus
+            }
+            self.finish(_dumps(result))
         except Exception as e:
             self.set_status(500)
-            self.finish(json.dumps({'error': f'Error reading FITS file: {str(e)}'}))
+            self.finish(_dumps({'error': f'Error reading FITS file: {str(e)}'}))
 
 
 class FITSSliceHandler(JupyterHandler):
@@ -141,30 +549,39 @@ class FITSSliceHandler(JupyterHandler):
     - Axis order matches NumPy (e.g., for 3D data: z,y,x or depth,row,col)
     - Half-open intervals [start, stop) with exclusive upper bound
     - Format: "start:stop,start:stop,..." for each axis
+
+    The optional precision parameter ('f32' or 'u16') requests a lossy
+    preview of the data, see _quantize.
     """
 
+    # Set once the client disconnects, so a streaming response stops early
+    _client_gone = False
+
     @tornado.web.authenticated
     async def get(self):
         path = self.get_argument('path')
         hdu = int(self.get_argument('hdu', 0))
         slices_str = self.get_argument('slices')  # e.g., "0:10,5:15" for 2D
+        precision = self.get_argument('precision', None)  # lossy preview mode
+
+        if precision is not None and precision not in _PRECISIONS:
+            self.set_status(400)
+            self.finish(_dumps({
+                'error': f"Invalid precision: '{precision}'. Expected one of {', '.join(_PRECISIONS)}."
+            }))
+            return
 
         # Parse slices parameter
         try:
-            slice_tuples = []
-            for s in slices_str.split(','):
-                parts = s.strip().split(':')
-                if len(parts) != 2:
-                    raise ValueError(f"Invalid slice format: '{s}'. Expected 'start:stop'.")
-                start, stop = int(parts[0]), int(parts[1])
-                if start < 0 or stop < 0:
-                    raise ValueError(f"Negative indices not supported: '{s}'")
-                if start >= stop:
-                    raise ValueError(f"Start must be less than stop: '{s}'")
-                slice_tuples.append((start, stop))
+            if len(slices_str) > _MAX_SLICES_LENGTH:
+                raise ValueError(
+                    f'Slices argument too long ({len(slices_str)} characters, '
+                    f'maximum {_MAX_SLICES_LENGTH})'
+                )
+            slice_tuples = _parse_slices(slices_str)
         except ValueError as e:
             self.set_status(400)
-            self.finish(json.dumps({'error': str(e)}))
+            self.finish(_dumps({'error': str(e)}))
             return
 
         # Validate path exists via Contents API
@@ -173,67 +590,81 @@ class FITSSliceHandler(JupyterHandler):
             await cm.get(path, content=False)
         except Exception as e:
             self.set_status(404)
-            self.finish(json.dumps({'error': f'File not found: {path}'}))
+            self.finish(_dumps({'error': f'File not found: {path}'}))
             return
 
         # Get filesystem path for astropy
         os_path = cm._get_os_path(path)
 
         try:
-            with fits.open(os_path) as hdul:
-                if hdu >= len(hdul):
-                    self.set_status(400)
-                    self.finish(json.dumps({
-                        'error': f'HDU index {hdu} out of range (file has {len(hdul)} HDUs)'
-                    }))
-                    return
-
-                data = hdul[hdu].data
-                if data is None:
-                    self.set_status(400)
-                    self.finish(json.dumps({
-                        'error': f'HDU {hdu} has no data'
-                    }))
-                    return
-
-                # Validate number of slice dimensions matches data dimensions
-                if len(slice_tuples) != len(data.shape):
-                    self.set_status(400)
-                    self.finish(json.dumps({
-                        'error': f'Number of slice dimensions ({len(slice_tuples)}) does not match '
-                                 f'data dimensions ({len(data.shape)}). Data shape: {list(data.shape)}'
-                    }))
-                    return
-
-                # Validate slice bounds for each axis
-                for axis, ((start, stop), size) in enumerate(zip(slice_tuples, data.shape)):
-                    if stop > size:
-                        self.set_status(400)
-                        self.finish(json.dumps({
-                            'error': f'Slice [{start}:{stop}] on axis {axis} out of bounds '
-                                     f'for dimension size {size}. Data shape: {list(data.shape)}'
-                        }))
-                        return
-
-                # Build the slice tuple and extract data
-                numpy_slices = tuple(slice(start, stop) for start, stop in slice_tuples)
-                slice_data = data[numpy_slices]
-
-                # Convert to little-endian for JavaScript TypedArray compatibility
-                le_dtype = slice_data.dtype.newbyteorder('<')
-                slice_bytes = slice_data.astype(le_dtype).tobytes()
-
-                # Use ArrayType enum for consistent type representation
-                array_type = numpy_dtype_to_array_type(slice_data.dtype)
-
-                self.set_header('Content-Type', 'application/octet-stream')
-                self.set_header('X-FITS-Shape', json.dumps(list(slice_data.shape)))
-                self.set_header('X-FITS-Type', array_type.value)
-                self.finish(slice_bytes)
-
+            loop = asyncio.get_running_loop()
+            async with _cached_hdul(os_path) as entry:
+                arr, array_type, scale = await loop.run_in_executor(
+                    _FITS_EXECUTOR, _read_slice, entry, hdu, slice_tuples, precision
+                )
+        except _InvalidRequest as e:
+            self.set_status(400)
+            self.finish(_dumps({'error': str(e)}))
+            return
         except Exception as e:
             self.set_status(500)
-            self.finish(json.dumps({'error': f'Error reading FITS data: {str(e)}'}))
+            self.finish(_dumps({'error': f'Error reading FITS data: {str(e)}'}))
+            return
+
+        nbytes = arr.nbytes
+        self.set_header('Content-Type', 'application/octet-stream')
+        self.set_header('X-FITS-Shape', _dumps(list(arr.shape)))
+        self.set_header('X-FITS-Type', array_type)
+        if scale is not None:
+            self.set_header('X-FITS-Scale-Min', repr(scale[0]))
+            self.set_header('X-FITS-Scale-Max', repr(scale[1]))
+        # Uncompressed size, for progress reporting when Content-Length is
+        # the compressed size or absent
+        self.set_header('X-FITS-Bytes', str(nbytes))
+        self.set_header('Vary', 'Accept-Encoding')
+
+        # Stream in chunks so Tornado's write buffer never holds a second full
+        # copy of a large slice. The frontend aborts in-flight slice requests
+        # while the user pans, so a client going away mid-body is routine and
+        # just ends the response.
+        buf = memoryview(arr).cast('B')
+        accept_encoding = self.request.headers.get('Accept-Encoding', '')
+        try:
+            if nbytes > _GZIP_MIN_BYTES and 'gzip' in accept_encoding:
+                # The compressed size isn't known up front, so no Content-Length
+                self.set_header('Content-Encoding', 'gzip')
+                compressor = zlib.compressobj(level=1, wbits=31)
+                for offset in range(0, nbytes, _CHUNK_SIZE):
+                    if self._client_gone:
+                        return
+                    compressed = await loop.run_in_executor(
+                        _FITS_EXECUTOR, compressor.compress, buf[offset:offset + _CHUNK_SIZE]
+                    )
+                    if compressed:
+                        self.write(compressed)
+                        await self.flush()
+                self.finish(compressor.flush())
+            elif isinstance(self.request.connection, HTTP1Connection):
+                # Send the headers, then hand the array's buffer straight to the
+                # connection: IOStream queues large memoryviews without copying,
+                # where RequestHandler.write only takes bytes. arr stays referenced
+                # until the write future resolves.
+                self.set_header('Content-Length', str(nbytes))
+                await self.flush()
+                await self.request.connection.write(buf)
+                self.finish()
+            else:
+                self.set_header('Content-Length', str(nbytes))
+                for offset in range(0, nbytes, _CHUNK_SIZE):
+                    self.write(bytes(buf[offset:offset + _CHUNK_SIZE]))
+                    await self.flush()
+                self.finish()
+        except StreamClosedError:
+            return
+
+    def on_connection_close(self):
+        self._client_gone = True
+        super().on_connection_close()
 
 
 def setup_handlers(web_app):
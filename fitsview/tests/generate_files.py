@@ -9,43 +9,47 @@ if __name__ == "__main__":
     dest = pathlib.Path(sys.argv[1])
     if not dest.is_dir():
         raise RuntimeError(f"Make sure the directory {sys.argv[1]} exists for the destination")
+    # Header verification and checksums aren't needed for generated files
+    write_opts = dict(overwrite=True, output_verify='ignore', checksum=False)
     rng = np.random.default_rng(seed=0)
+    min_bytes = 5.5e6
+    bytes_per_double = 4
+    npix_per_side = math.ceil(math.sqrt(min_bytes / bytes_per_double))
+    # Draw random values once, at the largest size, and cut the smaller
+    # cases out of it
+    big_3d = rng.random((5, npix_per_side, npix_per_side), dtype=np.float64)
     # cases to cover:
     # - simple 2D image
-    simple_2d = rng.random((16, 16))
-    fits.PrimaryHDU(simple_2d).writeto(dest / 'simple_2d.fits', overwrite=True)
+    simple_2d = np.ascontiguousarray(big_3d[0, :16, :16])
+    fits.PrimaryHDU(simple_2d).writeto(dest / 'simple_2d.fits', **write_opts)
     # - simple 2D image (integers)
-    simple_2d_uints = (1000 * rng.random((16, 16))).astype(np.uint16)
-    fits.PrimaryHDU(simple_2d_uints).writeto(dest / 'simple_2d_uints.fits', overwrite=True)
+    simple_2d_uints = (1000 * big_3d[1, :16, :16]).astype(np.uint16)
+    fits.PrimaryHDU(simple_2d_uints).writeto(dest / 'simple_2d_uints.fits', **write_opts)
     # - simple 2D image > 5MB
-    min_bytes = 5.5e6
-    bytes_per_double = 4
-    npix_per_side = math.ceil(math.sqrt(min_bytes / bytes_per_double))
-    big_2d = rng.random((npix_per_side, npix_per_side), dtype=np.float64)
+    big_2d = big_3d[2]
     assert big_2d.nbytes >= min_bytes
-    fits.PrimaryHDU(big_2d).writeto(dest / 'big_2d.fits', overwrite=True)
+    fits.PrimaryHDU(big_2d).writeto(dest / 'big_2d.fits', **write_opts)
     # - 3D data cube
-    simple_3d = rng.random((5, 16, 16))
-    fits.PrimaryHDU(simple_3d).writeto(dest / 'simple_3d.fits', overwrite=True)
+    simple_3d = np.ascontiguousarray(big_3d[:, 16:32, :16])
+    fits.PrimaryHDU(simple_3d).writeto(dest / 'simple_3d.fits', **write_opts)
     # - 3D data cube where 1 plane > 5 MB
-    big_3d = rng.random((5, npix_per_side, npix_per_side), dtype=np.float64)
     assert big_3d[0].nbytes >= min_bytes
-    fits.PrimaryHDU(big_3d).writeto(dest / 'big_3d.fits', overwrite=True)
+    fits.PrimaryHDU(big_3d).writeto(dest / 'big_3d.fits', **write_opts)
     # - 4D hypercube
-    simple_4d = rng.random((4, 5, 16, 16))
-    fits.PrimaryHDU(simple_4d).writeto(dest / 'simple_4d.fits', overwrite=True)
+    simple_4d = big_3d[:4, 32:112, :16].reshape(4, 5, 16, 16)
+    fits.PrimaryHDU(simple_4d).writeto(dest / 'simple_4d.fits', **write_opts)
     # - file with no image extensions
     table_hdu = fits.TableHDU(np.ones((10,), dtype=[('x', float), ('y', float)]), name='TABLE')
-    table_hdu.writeto(dest / 'no_image.fits', overwrite=True)
+    table_hdu.writeto(dest / 'no_image.fits', **write_opts)
     # - file with multiple extensions
     fits.HDUList([
         fits.PrimaryHDU(),
         fits.ImageHDU(simple_4d, name='FOURDEE'),
         table_hdu,
-    ]).writeto(dest / 'multi_ext.fits', overwrite=True)
+    ]).writeto(dest / 'multi_ext.fits', **write_opts)
     # - file with multiple *image* extensions
     fits.HDUList([
         fits.PrimaryHDU(),
         fits.ImageHDU(simple_4d, name='FOURDEE'),
         fits.ImageHDU(simple_3d, name='THREEDEE')
-    ]).writeto(dest / 'multi_image_ext.fits', overwrite=True)
+    ]).writeto(dest / 'multi_image_ext.fits', **write_opts)
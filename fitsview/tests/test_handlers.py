@@ -1,11 +1,18 @@
 """Tests for FITS API handlers."""
 
+import asyncio
 import json
+import logging
+import mmap
+import socket
+import threading
 
 import numpy as np
 import pytest
 from astropy.io import fits
 
+from fitsview import handlers
+
 
 @pytest.fixture
 def fits_file(jp_root_dir):
@@ -64,6 +71,63 @@ def cube_fits_file(jp_root_dir):
     return "cube_test.fits"
 
 
+@pytest.fixture
+def uint16_fits_file(jp_root_dir):
+    """Create a test FITS file with uint16 data (stored with BZERO offset)."""
+    data = np.arange(64, dtype=np.uint16).reshape(8, 8) + 40000
+    hdu = fits.PrimaryHDU(data)
+    hdul = fits.HDUList([hdu])
+
+    fits_path = jp_root_dir / "uint16_test.fits"
+    hdul.writeto(fits_path, overwrite=True)
+    hdul.close()
+
+    return "uint16_test.fits"
+
+
+@pytest.fixture
+def large_fits_file(jp_root_dir):
+    """Create a test FITS file large enough for slices to be compressed."""
+    data = np.arange(512 * 512, dtype=np.float64).reshape(512, 512)
+    hdu = fits.PrimaryHDU(data)
+    hdul = fits.HDUList([hdu])
+
+    fits_path = jp_root_dir / "large_test.fits"
+    hdul.writeto(fits_path, overwrite=True)
+    hdul.close()
+
+    return "large_test.fits"
+
+
+@pytest.fixture
+def uint8_fits_file(jp_root_dir):
+    """Create a test FITS file with uint8 (BITPIX 8) data."""
+    data = np.arange(60, dtype=np.uint8).reshape(3, 4, 5)
+    hdu = fits.PrimaryHDU(data)
+    hdul = fits.HDUList([hdu])
+
+    fits_path = jp_root_dir / "uint8_test.fits"
+    hdul.writeto(fits_path, overwrite=True)
+    hdul.close()
+
+    return "uint8_test.fits"
+
+
+@pytest.fixture
+def groups_fits_file(jp_root_dir):
+    """Create a random-groups FITS file (as used by UVFITS)."""
+    data = np.arange(24, dtype=np.float32).reshape(2, 1, 3, 4)
+    pardata = np.arange(2, dtype=np.float32)
+    group_data = fits.GroupData(data, parnames=["UU"], pardata=[pardata], bitpix=-32)
+    hdul = fits.HDUList([fits.GroupsHDU(group_data)])
+
+    fits_path = jp_root_dir / "groups_test.fits"
+    hdul.writeto(fits_path, overwrite=True)
+    hdul.close()
+
+    return "groups_test.fits"
+
+
 class TestMetadataHandler:
     """Tests for the FITSMetadataHandler."""
 
@@ -106,6 +170,82 @@ class TestMetadataHandler:
         assert table["index"] == 2
         assert table["name"] == "TABLE"
         assert table["type"] == "BinTableHDU"
+        assert table["shape"] == [3]
+        assert table["arrayType"] is None
+
+    async def test_metadata_scaled_unsigned(self, jp_fetch, uint16_fits_file):
+        """Test that the type reported for BZERO-offset data matches what slices return."""
+        response = await jp_fetch("fitsview", "metadata", params={"path": uint16_fits_file})
+
+        primary = json.loads(response.body)["hdus"][0]
+        assert primary["shape"] == [8, 8]
+        assert primary["arrayType"] == "u16"
+
+    async def test_metadata_random_groups(self, jp_fetch, groups_fits_file):
+        """Test that random groups are described by their group count, not as an image."""
+        response = await jp_fetch("fitsview", "metadata", params={"path": groups_fits_file})
+
+        primary = json.loads(response.body)["hdus"][0]
+        assert primary["type"] == "GroupsHDU"
+        assert primary["shape"] == [2]
+        assert primary["arrayType"] is None
+
+    async def test_metadata_reflects_modified_file(self, jp_fetch, jp_root_dir, float64_fits_file):
+        """Test that a file rewritten between requests is not served from the HDUList cache."""
+        response = await jp_fetch("fitsview", "metadata", params={"path": float64_fits_file})
+        assert json.loads(response.body)["hdus"][0]["shape"] == [2, 2]
+
+        fits.PrimaryHDU(np.zeros((3, 4), dtype=np.float64)).writeto(
+            jp_root_dir / float64_fits_file, overwrite=True
+        )
+
+        response = await jp_fetch("fitsview", "metadata", params={"path": float64_fits_file})
+        assert json.loads(response.body)["hdus"][0]["shape"] == [3, 4]
+
+    async def test_file_rewritten_mid_request(self, jp_root_dir, fits_file):
+        """Test that a request still holding a stale HDUList can finish with it."""
+        os_path = str(jp_root_dir / fits_file)
+        loop = asyncio.get_running_loop()
+        async with handlers._cached_hdul(os_path) as old:
+            fits.PrimaryHDU(np.zeros((3, 4), dtype=np.float32)).writeto(os_path, overwrite=True)
+            async with handlers._cached_hdul(os_path) as new:
+                assert new is not old
+                assert new.hdul[0].data.shape == (3, 4)
+
+            # HDU 1 has not been loaded yet, so this reads the old file
+            arr, array_type, _ = await loop.run_in_executor(
+                handlers._FITS_EXECUTOR, handlers._read_slice, old, 1, ((0, 2), (0, 2)), None
+            )
+            np.testing.assert_array_equal(arr, [[0, 1], [10, 11]])
+            assert array_type == "i16"
+            hdus = await loop.run_in_executor(
+                handlers._FITS_EXECUTOR, handlers._read_metadata, old
+            )
+            assert [h["name"] for h in hdus] == ["PRIMARY", "SCI", "TABLE"]
+            assert not old.hdul._file.closed
+
+        assert old.hdul._file.closed
+
+    async def test_cache_hit_stats_off_event_loop(self, jp_root_dir, fits_file, monkeypatch):
+        """Test that checking a cached HDUList for changes does not stat the file on the event loop."""
+        os_path = str(jp_root_dir / fits_file)
+        async with handlers._cached_hdul(os_path):
+            pass
+
+        stat_threads = []
+        real_stat = handlers.os.stat
+
+        def stat(path, *args, **kwargs):
+            if path == os_path:
+                stat_threads.append(threading.current_thread())
+            return real_stat(path, *args, **kwargs)
+
+        monkeypatch.setattr(handlers.os, "stat", stat)
+        async with handlers._cached_hdul(os_path):
+            pass
+
+        assert stat_threads
+        assert threading.main_thread() not in stat_threads
 
     async def test_metadata_file_not_found(self, jp_fetch):
         """Test that 404 is returned for non-existent files."""
@@ -192,6 +332,53 @@ class TestSliceHandler:
         expected = np.array([[1.5, 2.5], [3.5, 4.5]], dtype=np.float64)
         np.testing.assert_array_almost_equal(data, expected)
 
+    async def test_get_slice_uint16(self, jp_fetch, uint16_fits_file):
+        """Test retrieving scaled unsigned data, which astropy returns in native byte order."""
+        response = await jp_fetch(
+            "fitsview",
+            "slice",
+            params={"path": uint16_fits_file, "hdu": "0", "slices": "2:5,1:8"},
+        )
+
+        assert response.code == 200
+        assert response.headers["X-FITS-Type"] == "u16"
+        assert int(response.headers["Content-Length"]) == 3 * 7 * 2
+
+        data = np.frombuffer(response.body, dtype="<u2").reshape(3, 7)
+        expected = (np.arange(64, dtype=np.uint16).reshape(8, 8) + 40000)[2:5, 1:8]
+        np.testing.assert_array_equal(data, expected)
+
+    @pytest.mark.parametrize("slices", ["1:3,0:4,0:5", "0:3,1:3,2:4"])
+    async def test_get_slice_uint8(self, jp_fetch, uint8_fits_file, slices):
+        """Test contiguous and strided slices of uint8 data."""
+        response = await jp_fetch(
+            "fitsview",
+            "slice",
+            params={"path": uint8_fits_file, "hdu": "0", "slices": slices},
+        )
+
+        assert response.code == 200
+        assert response.headers["X-FITS-Type"] == "u8"
+
+        numpy_slices = tuple(slice(*map(int, s.split(":"))) for s in slices.split(","))
+        expected = np.arange(60, dtype=np.uint8).reshape(3, 4, 5)[numpy_slices]
+        shape = json.loads(response.headers["X-FITS-Shape"])
+        data = np.frombuffer(response.body, dtype="u1").reshape(shape)
+        np.testing.assert_array_equal(data, expected)
+
+    async def test_slice_uint8_copied_from_file(self, jp_root_dir, uint8_fits_file):
+        """Test that unswapped slices are copies, not views of the file's memory map."""
+        async with handlers._cached_hdul(str(jp_root_dir / uint8_fits_file)) as entry:
+            assert entry.hdul.fileinfo(0)["file"].memmap
+            arr, _, _ = handlers._read_slice(entry, 0, ((0, 3), (0, 4), (0, 5)))
+
+        assert arr.flags.c_contiguous
+        base = arr
+        while base is not None:
+            assert not isinstance(base, mmap.mmap)
+            base = getattr(base, "base", None)
+        np.testing.assert_array_equal(arr, np.arange(60, dtype=np.uint8).reshape(3, 4, 5))
+
     async def test_get_slice_3d_cube(self, jp_fetch, cube_fits_file):
         """Test retrieving a slice from a 3D data cube."""
         # 3D data with shape [4, 5, 6], slice planes 1:3, rows 0:2, cols 2:5
@@ -214,6 +401,131 @@ class TestSliceHandler:
         expected = np.arange(120, dtype=np.float32).reshape(4, 5, 6)[1:3, 0:2, 2:5]
         np.testing.assert_array_almost_equal(data, expected)
 
+    async def test_get_slice_gzip(self, jp_fetch, large_fits_file):
+        """Test that large slices are gzip-compressed when the client accepts it."""
+        response = await jp_fetch(
+            "fitsview",
+            "slice",
+            params={"path": large_fits_file, "hdu": "0", "slices": "0:512,0:512"},
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.code == 200
+        # The test client decompresses the body and records the encoding it removed
+        assert response.headers["X-Consumed-Content-Encoding"] == "gzip"
+        assert int(response.headers["X-FITS-Bytes"]) == 512 * 512 * 8
+
+        data = np.frombuffer(response.body, dtype="<f8").reshape(512, 512)
+        expected = np.arange(512 * 512, dtype=np.float64).reshape(512, 512)
+        np.testing.assert_array_equal(data, expected)
+
+    async def test_get_slice_uncompressed(self, jp_fetch, large_fits_file):
+        """Test that large slices are sent as-is when the client doesn't accept gzip."""
+        response = await jp_fetch(
+            "fitsview",
+            "slice",
+            params={"path": large_fits_file, "hdu": "0", "slices": "0:512,0:512"},
+            # Otherwise the test client always sends Accept-Encoding: gzip
+            decompress_response=False,
+        )
+
+        assert response.code == 200
+        assert "Content-Encoding" not in response.headers
+        assert int(response.headers["Content-Length"]) == 512 * 512 * 8
+
+        data = np.frombuffer(response.body, dtype="<f8").reshape(512, 512)
+        expected = np.arange(512 * 512, dtype=np.float64).reshape(512, 512)
+        np.testing.assert_array_equal(data, expected)
+
+    async def test_get_slice_precision_f32(self, jp_fetch, float64_fits_file):
+        """Test that precision=f32 sends float64 data as float32."""
+        response = await jp_fetch(
+            "fitsview",
+            "slice",
+            params={"path": float64_fits_file, "hdu": "0", "slices": "0:2,0:2", "precision": "f32"},
+        )
+
+        assert response.code == 200
+        assert response.headers["X-FITS-Type"] == "f32"
+
+        data = np.frombuffer(response.body, dtype="<f4").reshape(2, 2)
+        expected = np.array([[1.5, 2.5], [3.5, 4.5]], dtype=np.float32)
+        np.testing.assert_array_equal(data, expected)
+
+    async def test_get_slice_precision_u16(self, jp_fetch, float64_fits_file):
+        """Test that precision=u16 rescales data to the full uint16 range."""
+        response = await jp_fetch(
+            "fitsview",
+            "slice",
+            params={"path": float64_fits_file, "hdu": "0", "slices": "0:2,0:2", "precision": "u16"},
+        )
+
+        assert response.code == 200
+        assert response.headers["X-FITS-Type"] == "u16"
+        assert float(response.headers["X-FITS-Scale-Min"]) == 1.5
+        assert float(response.headers["X-FITS-Scale-Max"]) == 4.5
+
+        data = np.frombuffer(response.body, dtype="<u2").reshape(2, 2)
+        np.testing.assert_array_equal(data, [[0, 21845], [43690, 65535]])
+
+    async def test_slice_invalid_precision(self, jp_fetch, float64_fits_file):
+        """Test that an unknown precision returns 400."""
+        response = await jp_fetch(
+            "fitsview",
+            "slice",
+            params={"path": float64_fits_file, "hdu": "0", "slices": "0:2,0:2", "precision": "f8"},
+            raise_error=False,
+        )
+
+        assert response.code == 400
+        data = json.loads(response.body)
+        assert "precision" in data["error"].lower()
+
+    async def test_slice_client_disconnect(
+        self, jp_fetch, jp_root_dir, jp_http_port, jp_base_url, jp_auth_header, caplog
+    ):
+        """Test that a client aborting a large streamed slice doesn't log an uncaught error."""
+        rng = np.random.default_rng(seed=0)
+        fits.PrimaryHDU(rng.random((2048, 2048))).writeto(jp_root_dir / "abort_test.fits")
+        # Prime the HDUList cache with a normal request
+        await jp_fetch(
+            "fitsview", "slice", params={"path": "abort_test.fits", "hdu": "0", "slices": "0:1,0:1"}
+        )
+
+        auth = "".join(f"{key}: {value}\r\n" for key, value in jp_auth_header.items())
+        request = (
+            f"GET {jp_base_url}fitsview/slice?path=abort_test.fits&hdu=0&slices=0:2048,0:2048 HTTP/1.1\r\n"
+            f"Host: localhost:{jp_http_port}\r\nAccept-Encoding: gzip\r\n{auth}\r\n"
+        )
+        reader, writer = await asyncio.open_connection("localhost", jp_http_port)
+        writer.get_extra_info("socket").setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        writer.write(request.encode())
+        await reader.read(4096)
+        writer.close()
+        await asyncio.sleep(0.5)
+
+        errors = [r for r in caplog.records if r.levelno >= logging.ERROR]
+        assert errors == []
+
+    # Run twice so that the second run uses a new event loop after the first
+    # has contended on the HDUList cache
+    @pytest.mark.parametrize("run", [1, 2])
+    async def test_concurrent_slices(self, jp_fetch, cube_fits_file, run):
+        """Test many concurrent slice requests for the same file."""
+        responses = await asyncio.gather(*(
+            jp_fetch(
+                "fitsview",
+                "slice",
+                params={"path": cube_fits_file, "hdu": "0", "slices": f"{i % 4}:{i % 4 + 1},0:5,0:6"},
+            )
+            for i in range(16)
+        ))
+
+        expected = np.arange(120, dtype=np.float32).reshape(4, 5, 6)
+        for i, response in enumerate(responses):
+            data = np.frombuffer(response.body, dtype="<f4").reshape(1, 5, 6)
+            np.testing.assert_array_equal(data, expected[i % 4:i % 4 + 1])
+
     async def test_slice_out_of_bounds(self, jp_fetch, fits_file):
         """Test that out-of-bounds slices return 400."""
         response = await jp_fetch(
@@ -228,6 +540,18 @@ class TestSliceHandler:
         assert "error" in data
         assert "out of bounds" in data["error"].lower()
 
+    async def test_slice_huge_stop_out_of_bounds(self, jp_fetch, fits_file):
+        """Test that stops beyond the int64 range are out of bounds rather than a server error."""
+        response = await jp_fetch(
+            "fitsview",
+            "slice",
+            params={"path": fits_file, "hdu": "0", "slices": "0:99999999999999999999,0:1"},
+            raise_error=False,
+        )
+
+        assert response.code == 400
+        assert "out of bounds" in json.loads(response.body)["error"].lower()
+
     async def test_slice_dimension_mismatch(self, jp_fetch, fits_file):
         """Test that wrong number of slice dimensions returns 400."""
         # HDU 0 is 2D but we provide 3 slice dimensions
@@ -255,6 +579,33 @@ class TestSliceHandler:
         assert response.code == 400
         data = json.loads(response.body)
         assert "error" in data
+        assert "0:2:1" in data["error"]
+
+    async def test_slice_trailing_comma(self, jp_fetch, fits_file):
+        """Test that an empty trailing slice range returns 400."""
+        response = await jp_fetch(
+            "fitsview",
+            "slice",
+            params={"path": fits_file, "hdu": "0", "slices": "0:2,"},
+            raise_error=False,
+        )
+
+        assert response.code == 400
+        data = json.loads(response.body)
+        assert "invalid slice format" in data["error"].lower()
+
+    async def test_slice_too_long(self, jp_fetch, fits_file):
+        """Test that an oversized slices argument returns 400 without being parsed."""
+        response = await jp_fetch(
+            "fitsview",
+            "slice",
+            params={"path": fits_file, "hdu": "0", "slices": ",".join(["0:1"] * 100)},
+            raise_error=False,
+        )
+
+        assert response.code == 400
+        data = json.loads(response.body)
+        assert "too long" in data["error"].lower()
 
     async def test_slice_invalid_hdu(self, jp_fetch, fits_file):
         """Test that invalid HDU index returns 400."""
@@ -284,6 +635,18 @@ class TestSliceHandler:
         data = json.loads(response.body)
         assert "error" in data
 
+    async def test_slice_random_groups_error(self, jp_fetch, groups_fits_file):
+        """Test that requesting a slice from random groups returns 400."""
+        response = await jp_fetch(
+            "fitsview",
+            "slice",
+            params={"path": groups_fits_file, "hdu": "0", "slices": "0:1,0:3,0:4,0:1"},
+            raise_error=False,
+        )
+
+        assert response.code == 400
+        assert "no data" in json.loads(response.body)["error"].lower()
+
     async def test_slice_file_not_found(self, jp_fetch):
         """Test that 404 is returned for non-existent files."""
         response = await jp_fetch(
@@ -0,0 +1,27 @@
+"""Tests for the big-endian to little-endian conversion."""
+
+import numpy as np
+import pytest
+
+from fitsview._swap import _KERNEL_MIN_BYTES, to_little_endian
+
+
+@pytest.mark.parametrize("dtype", [">i2", ">u2", ">i4", ">f4", ">i8", ">f8", ">u1"])
+@pytest.mark.parametrize("nbytes", [64, 2 * _KERNEL_MIN_BYTES])
+def test_to_little_endian(dtype, nbytes):
+    """Test small (numpy) and large (kernel, when numba is installed) swaps."""
+    itemsize = np.dtype(dtype).itemsize
+    expected = np.arange(nbytes // itemsize).astype(dtype).reshape(-1, 4)
+
+    result = to_little_endian(expected)
+
+    assert result.dtype.byteorder in ("<", "|")
+    assert result.flags.c_contiguous
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_to_little_endian_strided():
+    """Test that non-contiguous slices are swapped correctly."""
+    data = np.arange(2 * _KERNEL_MIN_BYTES, dtype=">f8").reshape(-1, 64)
+
+    np.testing.assert_array_equal(to_little_endian(data[::3, 1:50]), data[::3, 1:50])
@@ -234,7 +234,11 @@ export async function requestBinaryAPIWithProgress(
   const shape = shapeHeader ? JSON.parse(shapeHeader) : [];
   const typeHeader = response.headers.get('X-FITS-Type');
   const arrayType = (typeHeader as ArrayType) || ArrayType.FLOAT64;
-  const contentLength = response.headers.get('Content-Length');
+  // X-FITS-Bytes is the uncompressed size, which is what the body reader
+  // yields even when the response is gzip-encoded without a Content-Length
+  const contentLength =
+    response.headers.get('X-FITS-Bytes') ??
+    response.headers.get('Content-Length');
   const total = contentLength ? parseInt(contentLength, 10) : 0;
 
   // If no progress callback or no content length, just get the buffer directly